@@ -0,0 +1,81 @@
+/*
+ * Kernel en C para solution_minesweeper.py (se carga con ctypes).
+ *
+ * Compilación:
+ *   Linux/Mac:  gcc -O3 -march=native -shared -fPIC -o _minesweeper.so _minesweeper.c
+ *   Windows:    gcc -O3 -march=native -shared -o _minesweeper.dll _minesweeper.c
+ *
+ * Con AVX2 disponible se procesan 32 celdas por instrucción: por cada fila se
+ * cargan las filas r-1, r y r+1 desplazadas -1/0/+1 columnas (9 cargas sobre un
+ * tablero con borde de ceros), se suman con _mm256_add_epi8 y las minas se
+ * reemplazan por 9 con _mm256_blendv_epi8. Sin AVX2 (u otras arquitecturas)
+ * se compila solo el recorrido escalar.
+ */
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#else
+#define EXPORT
+#endif
+
+/*
+ * in:  R*C celdas con 0 (vacía) o 1 (mina), por filas.
+ * out: R*C celdas con 9 (mina) o 0-8 (minas vecinas).
+ * Devuelve 0 si terminó bien, -1 si no pudo reservar memoria.
+ */
+EXPORT int minesweeper_c(const int8_t *in, int8_t *out, int R, int C)
+{
+    size_t S = (size_t)C + 2;
+    int8_t *pad = calloc(((size_t)R + 2) * S, 1);
+    if (pad == NULL)
+        return -1;
+    for (int r = 0; r < R; r++)
+        memcpy(pad + ((size_t)r + 1) * S + 1, in + (size_t)r * C, (size_t)C);
+
+    for (int r = 0; r < R; r++) {
+        /* punteros a la columna 0 de las filas r-1, r y r+1 dentro del borde */
+        const int8_t *up = pad + (size_t)r * S + 1;
+        const int8_t *mid = up + S;
+        const int8_t *down = mid + S;
+        int8_t *dst = out + (size_t)r * C;
+        int c = 0;
+
+#ifdef __AVX2__
+        const __m256i ones = _mm256_set1_epi8(1);
+        const __m256i nines = _mm256_set1_epi8(9);
+        for (; c + 32 <= C; c += 32) {
+            __m256i center = _mm256_loadu_si256((const __m256i *)(mid + c));
+            __m256i sum = _mm256_loadu_si256((const __m256i *)(up + c - 1));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(up + c)));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(up + c + 1)));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(mid + c - 1)));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(mid + c + 1)));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(down + c - 1)));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(down + c)));
+            sum = _mm256_add_epi8(sum, _mm256_loadu_si256((const __m256i *)(down + c + 1)));
+            __m256i is_mine = _mm256_cmpeq_epi8(center, ones);
+            _mm256_storeu_si256((__m256i *)(dst + c), _mm256_blendv_epi8(sum, nines, is_mine));
+        }
+#endif
+
+        for (; c < C; c++) {
+            if (mid[c] == 1) {
+                dst[c] = 9;
+                continue;
+            }
+            dst[c] = (int8_t)(up[c - 1] + up[c] + up[c + 1]
+                              + mid[c - 1] + mid[c + 1]
+                              + down[c - 1] + down[c] + down[c + 1]);
+        }
+    }
+
+    free(pad);
+    return 0;
+}
@@ -1,13 +1,112 @@
-import urllib.request
+import asyncio
+import functools
+import gzip
+import heapq
+import http.client
 import json
-from typing import Optional, List, Tuple
+import shelve
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, FrozenSet, Iterable, Iterator, Optional, List, Tuple
+from urllib.parse import urlsplit
+
+# Decodificador JSON más rápido disponible (orjson/ujson aceptan bytes directamente).
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
 
 API_BASE = "https://jsonmock.hackerrank.com/api/tvseries"
+MAX_WORKERS = 16
+CACHE_PATH = ".http_cache"
+CACHE_TTL = 300  # segundos que una respuesta en disco se considera fresca
+_ITEM_FIELDS = ("name", "genre", "imdb_rating")
+_REQUEST_HEADERS = {"Accept-Encoding": "gzip"}
+PANDAS_MIN_ROWS = 10_000  # con menos registros armar el DataFrame cuesta más de lo que ahorra
+
+# Pool de hilos compartido entre llamadas: cada hilo conserva su propia conexión
+# keep-alive, así no se repite el handshake TCP+TLS en cada página.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+_local = threading.local()
+_cache_lock = threading.Lock()
+
+def _get_connection(parts) -> http.client.HTTPConnection:
+    conn = getattr(_local, "conn", None)
+    if conn is None or conn.host != parts.hostname:
+        cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = cls(parts.netloc, timeout=10)
+        _local.conn = conn
+    return conn
+
+def _http_get(url: str) -> bytes:
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}"
+    conn = _get_connection(parts)
+    try:
+        conn.request("GET", path, headers=_REQUEST_HEADERS)
+        resp = conn.getresponse()
+        body = resp.read()
+    except (http.client.HTTPException, OSError):
+        # el servidor pudo cerrar la conexión ociosa: se reabre y se reintenta una vez
+        conn.close()
+        conn.request("GET", path, headers=_REQUEST_HEADERS)
+        resp = conn.getresponse()
+        body = resp.read()
+    if resp.status != 200:
+        raise http.client.HTTPException(f"HTTP {resp.status} en {url}")
+    if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+def _cache_get(url: str) -> Optional[dict]:
+    try:
+        with _cache_lock, shelve.open(CACHE_PATH) as db:
+            return db.get(url)
+    except Exception:
+        return None
+
+def _cache_put(url: str, body: bytes) -> None:
+    try:
+        with _cache_lock, shelve.open(CACHE_PATH) as db:
+            db[url] = {"ts": time.time(), "body": body}
+    except Exception:
+        pass
+
+@functools.lru_cache(maxsize=None)
+def _fetch_url(url: str) -> dict:
+    """
+    Descarga y parsea una URL de la API usando un caché en disco con TTL.
+    Si la petición falla y existe una respuesta vieja en caché, se devuelve esa.
+    """
+    cached = _cache_get(url)
+    if cached is not None and time.time() - cached["ts"] < CACHE_TTL:
+        return _json_loads(cached["body"])
+    try:
+        body = _http_get(url)
+    except Exception:
+        if cached is None:
+            raise
+        return _json_loads(cached["body"])
+    _cache_put(url, body)
+    return _json_loads(body)
 
 def fetch_page(page: int) -> dict:
-    url = f"{API_BASE}?page={page}"
-    with urllib.request.urlopen(url) as resp:
-        return json.load(resp)
+    return _fetch_url(f"{API_BASE}?page={page}")
+
+@functools.lru_cache(maxsize=None)
+def _genre_tokens(genre_field: str) -> FrozenSet[str]:
+    """
+    Tokens de género (minúsculas, sin espacios) de un campo "genre" de la API.
+    Las combinaciones de géneros se repiten mucho, así que cada cadena se
+    separa una sola vez y las demás consultas son O(1).
+    """
+    return frozenset(t for t in (t.strip().lower() for t in genre_field.split(",")) if t)
 
 def bestInGenre(genre: str) -> str:
     """
@@ -15,8 +114,11 @@ def bestInGenre(genre: str) -> str:
     En caso de empate en rating, devuelve el nombre alfabéticamente menor.
     Si no hay coincidencias, devuelve "No result".
     """
-    top = topNInGenre(genre, n=1)
-    return top[0][0] if top else "No result"
+    if not genre or not genre.strip():
+        return "No result"
+
+    best = asyncio.run(_best_async(genre.strip().lower()))
+    return best[1] if best else "No result"
 
 def topNInGenre(genre: str, n: int = 4) -> List[Tuple[str, float]]:
     """
@@ -27,45 +129,141 @@ def topNInGenre(genre: str, n: int = 4) -> List[Tuple[str, float]]:
     if not genre or not genre.strip():
         return []
 
-    genre_token = genre.strip().lower()
+    return asyncio.run(_topN_async(genre.strip().lower(), n))
+
+async def _pages_async() -> AsyncIterator[dict]:
+    """
+    Genera las páginas de la API a medida que llegan: lee la primera página
+    para conocer total_pages y luego pide las páginas 2..N de forma concurrente.
+    Las páginas que fallan se omiten; si falla la primera no se genera nada.
+    """
+    loop = asyncio.get_running_loop()
     try:
-        first = fetch_page(1)
+        first = await loop.run_in_executor(_executor, fetch_page, 1)
     except Exception:
-        return []
+        return
+    yield first
 
     total_pages = int(first.get("total_pages", 1))
-    matches: List[Tuple[str, float]] = []
-
-    def maybe_add(item: dict):
-        g = item.get("genre", "") or ""
-        tokens: List[str] = [t.strip().lower() for t in g.split(",") if t.strip()]
-        if genre_token not in tokens:
-            return
+    pending = [loop.run_in_executor(_executor, fetch_page, p) for p in range(2, total_pages + 1)]
+    for fut in asyncio.as_completed(pending):
         try:
-            rating = float(item.get("imdb_rating", 0) or 0)
+            yield await fut
         except Exception:
-            return
-        name = (item.get("name") or "").strip()
-        if not name:
-            return
-        matches.append((name, rating))
+            continue
+
+async def _best_async(genre_token: str) -> Optional[Tuple[float, str]]:
+    """
+    Mejor (rating, nombre) del género, actualizado página a página a medida que
+    llegan: sin lista de coincidencias ni ordenamiento, O(T) tiempo y O(1) memoria.
+    """
+    best = None
+    best_key = None
+    async for page_data in _pages_async():
+        for match in _iter_matches(page_data.get("data", []), genre_token):
+            key = _rank_key(match)
+            if best_key is None or key < best_key:
+                best_key = key
+                best = (match[1], match[0])
+    return best
 
-    # procesar primera página
-    for item in first.get("data", []):
-        maybe_add(item)
+async def _topN_async(genre_token: str, n: int) -> List[Tuple[str, float]]:
+    """Versión asíncrona de topNInGenre."""
+    items: List[dict] = []
+    async for page_data in _pages_async():
+        items.extend(page_data.get("data", []))
 
-    # procesar páginas restantes
-    for p in range(2, total_pages + 1):
+    if len(items) >= PANDAS_MIN_ROWS:
         try:
-            page_data = fetch_page(p)
-        except Exception:
+            import pandas as pd
+        except ImportError:
+            pass
+        else:
+            return _top_n_pandas(pd, items, genre_token, n)
+    return _top_n_python(items, genre_token, n)
+
+def _iter_matches(items: Iterable[dict], genre_token: str) -> Iterator[Tuple[str, float]]:
+    """Genera las tuplas (nombre, rating) de los registros que pertenecen al género."""
+    gt = genre_token
+    tokens_of = _genre_tokens
+    _float = float
+
+    for item in items:
+        if gt not in tokens_of(item.get("genre") or ""):
+            continue
+        # la API casi siempre trae el rating como número: solo se convierte
+        # (y se paga el try) cuando hace falta
+        v = item.get("imdb_rating")
+        if not v:
+            rating = 0.0
+        elif type(v) is float:
+            rating = v
+        else:
+            try:
+                rating = _float(v)
+            except Exception:
+                continue
+        name = (item.get("name") or "").strip()
+        if not name:
             continue
-        for item in page_data.get("data", []):
-            maybe_add(item)
+        yield (name, rating)
+
+def _parse_rating(v) -> Optional[float]:
+    """Rating como en _iter_matches: vacío cuenta como 0, None si no es numérico."""
+    if not v:
+        return 0.0
+    try:
+        return float(v)
+    except Exception:
+        return None
+
+def _rank_key(match: Tuple[str, float]) -> Tuple[bool, float, str]:
+    """
+    Clave de orden: rating desc, luego nombre asc. Un rating NaN no se puede
+    comparar, así que esas series van al final (por nombre) en vez de quedar
+    en un orden que depende de cómo llegaron.
+    """
+    name, rating = match
+    is_nan = rating != rating
+    return (is_nan, 0.0 if is_nan else -rating, name)
+
+def _top_n_python(items: List[dict], genre_token: str, n: int) -> List[Tuple[str, float]]:
+    # los n mejores por rating desc, luego por nombre asc: O(T log n) en vez de ordenar todo
+    return heapq.nsmallest(n, _iter_matches(items, genre_token), key=_rank_key)
+
+def _top_n_pandas(pd, items: List[dict], genre_token: str, n: int) -> List[Tuple[str, float]]:
+    """
+    Igual que _top_n_python pero con operaciones vectorizadas de pandas, para
+    cuando la cantidad de registros justifica el costo de armar el DataFrame.
+    """
+    df = pd.DataFrame.from_records(items, columns=list(_ITEM_FIELDS))
+
+    # mismos tokens que _genre_tokens: se separa por comas y se compara cada token
+    # completo, así un género con comas nunca coincide (igual que en Python)
+    tokens = df["genre"].fillna("").astype(str).str.split(",").explode().str.strip().str.lower()
+    mask = tokens.eq(genre_token).groupby(level=0).any()
+
+    # los ratings numéricos se convierten vectorizados; los que to_numeric no
+    # reconoce (vacíos, "nan", inválidos, ...) pasan por _parse_rating, así la
+    # regla es la misma que en _iter_matches: vacío cuenta como 0, NaN se
+    # conserva y lo no numérico se descarta
+    raw = pd.Series([item.get("imdb_rating") for item in items], dtype=object)
+    rating = pd.to_numeric(raw, errors="coerce").astype(float)
+    valid = pd.Series(True, index=raw.index)
+    pending = rating.isna()
+    if pending.any():
+        parsed = [_parse_rating(v) for v in raw[pending]]
+        rating[pending] = [float("nan") if r is None else r for r in parsed]
+        valid[pending] = [r is not None for r in parsed]
+    name = df["name"].fillna("").astype(str).str.strip()
 
-    # ordenar por rating desc, luego por nombre asc
-    matches.sort(key=lambda t: (-t[1], t[0]))
-    return matches[:n]
+    mask &= valid & name.ne("")
+    top = (
+        pd.DataFrame({"name": name[mask], "rating": rating[mask]})
+        .sort_values(["rating", "name"], ascending=[False, True], na_position="last")
+        .head(n)
+    )
+    return [(nm, float(r)) for nm, r in zip(top["name"], top["rating"])]
 
 if __name__ == "__main__":
     ejemplos = [
@@ -96,11 +294,34 @@ if __name__ == "__main__":
 
 """
  Explicación técnica (Probado en Python 3.8+.):
- - Se consulta la API paginada en https://jsonmock.hackerrank.com/api/tvseries?page=N usando urllib.
+ - Se consulta la API paginada en https://jsonmock.hackerrank.com/api/tvseries?page=N usando http.client
+   con conexiones keep-alive (una por hilo del pool), evitando un handshake TCP+TLS por página.
+   Las peticiones aceptan gzip: el JSON viaja comprimido (varias veces menos bytes) y se
+   descomprime al recibirlo.
+ - Tras leer la página 1 (que indica total_pages), las páginas 2..N se piden de forma concurrente
+   y se procesan a medida que llegan (asyncio.as_completed); cada descarga bloqueante corre en
+   un ThreadPoolExecutor (el GIL se libera durante la lectura del socket), así el tiempo total
+   es aproximadamente el de la petición más lenta y no la suma de todas.
+ - Las respuestas se cachean en memoria (lru_cache, mismo proceso) y en disco (shelve en .http_cache,
+   con TTL de CACHE_TTL segundos), así las consultas repetidas de __main__ no vuelven a descargar
+   las páginas. Si la API falla y hay una respuesta vencida en disco, se usa esa.
+ - El JSON se decodifica con orjson si está instalado (o ujson), con json estándar como respaldo.
+   Un parser en streaming (ijson) no compensa aquí: las páginas son de 10 registros y
+   decodificarlas completas en C es más rápido que recorrer eventos desde Python.
  - topNInGenre recopila todas las series que contienen el token de género solicitado#   (comparación por token, minúsculas, recortando espacios).
+   Los tokens de cada campo "genre" se calculan una sola vez como frozenset (cacheado por cadena),
+   así la pertenencia es O(1) y no se crea una lista nueva por registro.
  - Convierte imdb_rating a float (si falta o es inválido se descarta ese registro).
- - Ordena los matches por rating descendente y nombre ascendente, y devuelve los N primeros.# 
- - bestInGenre usa topNInGenre(genre, 1) para devolver solo el nombre de la mejor serie.
+ - Si hay al menos PANDAS_MIN_ROWS registros y pandas está instalado, el filtrado por género,
+   la conversión del rating y el ordenamiento se hacen vectorizados sobre un DataFrame. Con los
+   pocos cientos de registros actuales de la API se usa el recorrido en Python puro, que es más
+   rápido que importar pandas y construir el DataFrame.
+   Ambos caminos usan las mismas reglas (tokens completos separados por comas, rating vacío = 0,
+   NaN se conserva y queda al final del orden).
+ - Selecciona con heapq.nsmallest los N primeros por rating descendente y nombre ascendente
+   (O(T log N) en lugar de ordenar los T matches; para N=1 es un solo recorrido).# 
+ - bestInGenre no arma la lista de coincidencias: mantiene solo el mejor (rating, nombre) y lo
+   actualiza a medida que llegan las páginas (O(T) tiempo, O(1) memoria, sin ordenar).
  - En el bloque __main__ se imprimen ejemplos y se genera dinámicamente el "Sample Explanation" detallado en la documentacion.
 
 """
@@ -1,34 +1,39 @@
 import sqlite3
-import pandas as pd
 
 
 conn = sqlite3.connect(':memory:')
 cursor = conn.cursor()
 
 
-cursor.execute('''
+# Todo el DDL en una sola llamada a executescript
+cursor.executescript('''
 CREATE TABLE customers (
     id SMALLINT,
     first_name VARCHAR(64),
     last_name VARCHAR(64)
-)
-''')
+);
 
-cursor.execute('''
 CREATE TABLE campaigns (
     id SMALLINT,
     customer_id SMALLINT,
     name VARCHAR(64)
-)
-''')
+);
 
-cursor.execute('''
 CREATE TABLE events (
     dt VARCHAR(19),
     campaign_id SMALLINT,
-    status VARCHAR(64)
-)
+    status INTEGER
+);
+''')
+
+# La base es :memory:, no hace falta durabilidad: sin fsync y journal en memoria.
+# Las inserciones van en una única transacción explícita.
+cursor.executescript('''
+PRAGMA synchronous = OFF;
+PRAGMA journal_mode = MEMORY;
+PRAGMA temp_store = MEMORY;
 ''')
+cursor.execute('BEGIN')
 
 
 customers_data = [
@@ -70,28 +75,55 @@ events_data = [
     ('2021-12-02 11:56:50', 4, 'success'),
     ('2021-12-02 06:08:20', 5, 'success')
 ]
-cursor.executemany('INSERT INTO events VALUES (?, ?, ?)', events_data)
+# status se guarda como entero (0 = success, 1 = failure): filas más chicas y
+# el filtro compara enteros en lugar de cadenas.
+STATUS_CODES = {'success': 0, 'failure': 1}
+cursor.executemany(
+    'INSERT INTO events VALUES (?, ?, ?)',
+    [(dt, campaign_id, STATUS_CODES[status]) for dt, campaign_id, status in events_data]
+)
 
 conn.commit()
 
 
+# Índices para los JOINs y el filtro por status; ANALYZE deja estadísticas
+# para que el planificador de sqlite los elija.
+cursor.executescript('''
+CREATE INDEX idx_campaigns_customer ON campaigns(customer_id);
+CREATE INDEX idx_events_campaign_status ON events(campaign_id, status);
+ANALYZE;
+''')
+
+
 query = '''
+WITH failures AS (
+    SELECT campaign_id, COUNT(*) AS n
+    FROM events
+    WHERE status = 1  -- failure
+    GROUP BY campaign_id
+)
 SELECT 
     c.first_name || ' ' || c.last_name AS customer,
-    COUNT(e.status) AS failures
+    SUM(f.n) AS failures
 FROM customers c
 INNER JOIN campaigns cp ON c.id = cp.customer_id
-INNER JOIN events e ON cp.id = e.campaign_id
-WHERE e.status = 'failure'
+INNER JOIN failures f ON cp.id = f.campaign_id
 GROUP BY c.id, c.first_name, c.last_name
-HAVING COUNT(e.status) > 3
+HAVING SUM(f.n) > 3
 ORDER BY failures DESC
 '''
 
-result = pd.read_sql_query(query, conn)
+# Se lee directo del cursor: para un resultado de pocas filas no hace falta
+# importar pandas ni armar un DataFrame.
+cursor.execute(query)
+headers = [col[0] for col in cursor.description]
+rows = [[str(v) for v in row] for row in cursor.fetchall()]
+widths = [max([len(h)] + [len(row[i]) for row in rows]) for i, h in enumerate(headers)]
+
 print("\nReporte de Fallos en el Sistema de Publicidad")
 print("=" * 40)
-print(result.to_string(index=False))
+for line in [headers] + rows:
+    print("  ".join(v.rjust(w) for v, w in zip(line, widths)))
 conn.close()
 
 """
@@ -99,28 +131,33 @@ Requerimiento: Identificar clientes con más de 3 eventos de fallo en sus campa
 
 La solución requiere conectar las tres tablas (customers, campaigns, events) 
 y agregar el conteo de eventos con status='failure' por cliente.
+En la tabla events el status se guarda como entero: 0 = success, 1 = failure.
 
 Explicación de la query:
 
-SELECT c.first_name || ' ' || c.last_name AS customer, COUNT(e.status) AS failures
+WITH failures AS (SELECT campaign_id, COUNT(*) AS n FROM events WHERE status = 1 GROUP BY campaign_id)
+    Primero cuento los fallos por campaña. El filtro status=1 (failure) se aplica antes
+    del JOIN, así los JOINs trabajan sobre filas ya filtradas (una por campaña con fallos)
+    y no sobre todos los eventos. El índice (campaign_id, status) cubre la consulta:
+    sqlite la resuelve recorriendo solo el índice, ya ordenado por campaign_id.
+
+SELECT c.first_name || ' ' || c.last_name AS customer, SUM(f.n) AS failures
     Concateno el nombre completo del cliente usando el operador ||.
-    Luego cuento todos los eventos de fallo asociados a ese cliente.
+    Luego sumo los fallos de todas las campañas de ese cliente.
 
 FROM customers c
 INNER JOIN campaigns cp ON c.id = cp.customer_id  
-INNER JOIN events e ON cp.id = e.campaign_id
+INNER JOIN failures f ON cp.id = f.campaign_id
     Realizo los JOINs necesarios para conectar las tablas. Utilizo INNER JOIN
-    porque solo necesito registros que existan en las tres tablas.
-    La relación es: customers -> campaigns -> events
-
-WHERE e.status = 'failure'
-    Filtro únicamente los eventos con status='failure', excluyendo los eventos exitosos.
+    porque solo necesito clientes con campañas que tengan fallos.
+    La relación es: customers -> campaigns -> failures (events)
+    El índice sobre campaigns(customer_id) evita recorrer la tabla completa por cliente.
 
 GROUP BY c.id, c.first_name, c.last_name
-    Agrupo por cliente para aplicar la función de agregación COUNT().
+    Agrupo por cliente para aplicar la función de agregación SUM().
     Incluyo el id además del nombre para evitar ambigüedades en caso de nombres duplicados.
 
-HAVING COUNT(e.status) > 3
+HAVING SUM(f.n) > 3
     Filtro los grupos resultantes para incluir solo clientes con más de 3 fallos.
     Importante: HAVING actúa después del GROUP BY, mientras que WHERE actúa antes.
     La condición es estrictamente mayor (>3), no mayor o igual.